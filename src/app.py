@@ -1,98 +1,239 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
-from typing import Any, Dict
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import orjson
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from sklearn.linear_model import LinearRegression
+
+from .model import (
+    DIFFICULTIES,
+    LinearPredictor,
+    difficulty_codes,
+    encode_features,
+    load_artifact,
+)
+from .predict_batch import predict_scores
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib json."""
+
+    compact = True
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
 
-import joblib
-import pandas as pd
-from flask import Flask, jsonify, request
 
 app = Flask(__name__)
+app.json_provider_class = OrjsonProvider
+app.json = OrjsonProvider(app)
 
 # Global model artifact (loaded once at startup)
 MODEL_ARTIFACT = None
+# Training feature order, cached alongside the artifact
+FEATURE_NAMES: List[str] = []
+HOURS_IDX: Optional[int] = None
+# Feature vector per difficulty with its indicator already set; /predict only
+# has to fill in hours_studied
+FEATURE_TEMPLATES: Dict[str, np.ndarray] = {}
+# Largest JSON array accepted by /predict_batch
+MAX_BATCH_SIZE = 10_000
+# Generous upper bound on one serialized batch item; Werkzeug rejects larger
+# request bodies with 413 before reading them
+MAX_ITEM_BYTES = 256
+app.config["MAX_CONTENT_LENGTH"] = MAX_BATCH_SIZE * MAX_ITEM_BYTES
+# Linear model parameters for the fast prediction path (None for other models)
+MODEL_COEF: Optional[np.ndarray] = None
+MODEL_INTERCEPT = 0.0
 
 
-def load_model(model_path: str = "models/model.joblib") -> Dict[str, Any]:
+def load_model(model_path: str = "models/model.npz") -> Dict[str, Any]:
     """Load the trained model artifact."""
-    global MODEL_ARTIFACT
+    global MODEL_ARTIFACT, FEATURE_NAMES, HOURS_IDX, FEATURE_TEMPLATES
+    global MODEL_COEF, MODEL_INTERCEPT
     if MODEL_ARTIFACT is None:
-        if not Path(model_path).exists():
-            raise FileNotFoundError(f"Model not found at {model_path}. Train the model first.")
-        MODEL_ARTIFACT = joblib.load(model_path)
+        artifact = load_artifact(model_path)
+        model = artifact["model"]
+        FEATURE_NAMES = list(artifact["feature_names"])
+        HOURS_IDX = (
+            FEATURE_NAMES.index("hours_studied")
+            if "hours_studied" in FEATURE_NAMES
+            else None
+        )
+        templates = encode_features(
+            None, np.arange(len(DIFFICULTIES)), FEATURE_NAMES
+        )
+        FEATURE_TEMPLATES = dict(zip(DIFFICULTIES, templates))
+        if (
+            isinstance(model, (LinearRegression, LinearPredictor))
+            and np.ndim(model.coef_) == 1
+        ):
+            # asarray keeps a memory-mapped float64 coef_ shared, not copied
+            MODEL_COEF = np.asarray(model.coef_, dtype=np.float64)
+            MODEL_INTERCEPT = float(model.intercept_)
+        MODEL_ARTIFACT = artifact
     return MODEL_ARTIFACT
 
 
+# Preload at import so the first request does not pay the load cost and
+# pre-forking servers share the loaded arrays; endpoints retry lazily if the
+# model has not been trained yet
+try:
+    load_model()
+except FileNotFoundError:
+    pass
+
+
 @app.route("/health", methods=["GET"])
 def health_check() -> Dict[str, str]:
     """Health check endpoint."""
     return {"status": "healthy", "message": "API is running"}
 
 
+def _err(message: str, status: int) -> Response:
+    """Build a JSON error response without going through jsonify."""
+    return app.response_class(
+        orjson.dumps({"error": message}), status=status, mimetype="application/json"
+    )
+
+
+@app.errorhandler(413)
+def request_too_large(e: Exception) -> Response:
+    """Report oversized request bodies as JSON like the other errors."""
+    return _err("Request body too large", 413)
+
+
 @app.route("/predict", methods=["POST"])
 def predict() -> Dict[str, Any]:
     """Predict exam score based on hours studied and exam difficulty."""
+    # Load model if not already loaded
     try:
-        # Load model if not already loaded
         artifact = load_model()
-        model = artifact["model"] if isinstance(artifact, dict) else artifact
-        feature_names = (
-            artifact.get("feature_names", None) if isinstance(artifact, dict) else None
-        )
+    except FileNotFoundError as e:
+        return _err(f"Prediction failed: {e}", 500)
+    model = artifact["model"]
 
-        # Get request data
-        data = request.get_json()
-        if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
+    # Get request data, parsing the raw body with orjson
+    raw = request.get_data(cache=False)
+    if not raw:
+        return _err("No JSON data provided", 400)
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return _err("Invalid JSON", 400)
+    if not data:
+        return _err("No JSON data provided", 400)
+    if not isinstance(data, dict):
+        return _err("JSON body must be an object", 400)
 
-        hours = data.get("hours_studied")
-        difficulty = data.get("exam_difficulty", "Medium")
+    hours = data.get("hours_studied")
+    difficulty = data.get("exam_difficulty", "Medium")
 
-        # Validate input
-        if hours is None:
-            return jsonify({"error": "hours_studied is required"}), 400
-        
-        try:
-            hours = float(hours)
-        except (ValueError, TypeError):
-            return jsonify({"error": "hours_studied must be a number"}), 400
+    # Validate input
+    if hours is None:
+        return _err("hours_studied is required", 400)
+    try:
+        hours = float(hours)
+    except (ValueError, TypeError):
+        return _err("hours_studied must be a number", 400)
+    if not math.isfinite(hours):
+        return _err("hours_studied must be a finite number", 400)
+
+    if difficulty not in DIFFICULTIES:
+        return _err("exam_difficulty must be Easy, Medium, or Hard", 400)
 
-        if difficulty not in ["Easy", "Medium", "Hard"]:
-            return jsonify({"error": "exam_difficulty must be Easy, Medium, or Hard"}), 400
+    # Start from the precomputed vector for this difficulty
+    vec = FEATURE_TEMPLATES[difficulty].copy()
+    if HOURS_IDX is not None:
+        vec[HOURS_IDX] = hours
+
+    # Make prediction; linear models skip sklearn's per-call validation
+    try:
+        if MODEL_COEF is not None:
+            prediction = float(np.dot(MODEL_COEF, vec) + MODEL_INTERCEPT)
+        else:
+            prediction = float(model.predict(vec[np.newaxis, :])[0])
+    except (ValueError, RuntimeError) as e:
+        return _err(f"Prediction failed: {e}", 500)
 
-        # Construct feature vector
-        base = {
+    # Clamp prediction to reasonable range (0-100)
+    prediction = max(0.0, min(100.0, prediction))
+
+    return jsonify({
+        "predicted_score": round(prediction, 2),
+        "input": {
             "hours_studied": hours,
-            "difficulty_Easy": 1.0 if difficulty == "Easy" else 0.0,
-            "difficulty_Medium": 1.0 if difficulty == "Medium" else 0.0,
-            "difficulty_Hard": 1.0 if difficulty == "Hard" else 0.0,
+            "exam_difficulty": difficulty
         }
-        X = pd.DataFrame([base])
+    })
 
-        # Ensure feature order matches training
-        if feature_names is not None:
-            for col in feature_names:
-                if col not in X.columns:
-                    X[col] = 0.0
-            X = X[feature_names]
 
-        # Make prediction
-        prediction = float(model.predict(X)[0])
-        
-        # Clamp prediction to reasonable range (0-100)
-        prediction = max(0.0, min(100.0, prediction))
+@app.route("/predict_batch", methods=["POST"])
+def predict_batch() -> Dict[str, Any]:
+    """Predict exam scores for a JSON array of /predict-style inputs."""
+    try:
+        artifact = load_model()
+    except FileNotFoundError as e:
+        return _err(f"Batch prediction failed: {e}", 500)
+    model = artifact["model"]
 
-        return jsonify({
-            "predicted_score": round(prediction, 2),
-            "input": {
-                "hours_studied": hours,
-                "exam_difficulty": difficulty
-            }
-        })
+    raw = request.get_data(cache=False)
+    if not raw:
+        return _err("No JSON data provided", 400)
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return _err("Invalid JSON", 400)
+    if not isinstance(data, list) or not data:
+        return _err("Expected a non-empty JSON array", 400)
+    if len(data) > MAX_BATCH_SIZE:
+        return _err(f"At most {MAX_BATCH_SIZE} items can be scored per request", 413)
 
-    except Exception as e:
-        return jsonify({"error": f"Prediction failed: {str(e)}"}), 500
+    # Validate every item before scoring any of them
+    hours = []
+    difficulties = []
+    for i, item in enumerate(data):
+        if not isinstance(item, dict) or item.get("hours_studied") is None:
+            return _err(f"Item {i}: hours_studied is required", 400)
+        try:
+            value = float(item["hours_studied"])
+        except (ValueError, TypeError):
+            return _err(f"Item {i}: hours_studied must be a number", 400)
+        if not math.isfinite(value):
+            return _err(f"Item {i}: hours_studied must be a finite number", 400)
+        hours.append(value)
+        difficulty = item.get("exam_difficulty", "Medium")
+        if difficulty not in DIFFICULTIES:
+            return _err(
+                f"Item {i}: exam_difficulty must be Easy, Medium, or Hard", 400
+            )
+        difficulties.append(difficulty)
+
+    try:
+        if MODEL_COEF is not None:
+            predictions = predict_scores(
+                hours, difficulties, MODEL_COEF, MODEL_INTERCEPT, FEATURE_NAMES
+            )
+        else:
+            X = encode_features(hours, difficulty_codes(difficulties), FEATURE_NAMES)
+            predictions = np.clip(model.predict(X), 0.0, 100.0)
+    except (ValueError, RuntimeError) as e:
+        return _err(f"Batch prediction failed: {e}", 500)
+
+    return jsonify({
+        "predicted_scores": np.round(predictions, 2).tolist(),
+    })
 
 
 @app.route("/model_info", methods=["GET"])
@@ -100,10 +241,8 @@ def model_info() -> Dict[str, Any]:
     """Get information about the loaded model."""
     try:
         artifact = load_model()
-        model = artifact["model"] if isinstance(artifact, dict) else artifact
-        feature_names = (
-            artifact.get("feature_names", None) if isinstance(artifact, dict) else None
-        )
+        model = artifact["model"]
+        feature_names = artifact["feature_names"]
 
         return jsonify({
             "model_type": type(model).__name__,
@@ -115,4 +254,5 @@ def model_info() -> Dict[str, Any]:
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
+    # Development server only; production runs under gunicorn via wsgi.py
+    app.run(host="0.0.0.0", port=5000, debug=False)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+# libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _read_config(path: str) -> dict:
+    cfg_path = Path(path)
+    if not cfg_path.exists():
+        raise FileNotFoundError(f"Config not found: {cfg_path}")
+    with cfg_path.open("r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+def load_config(path: str | Path) -> dict:
+    """Load a YAML config file.
+
+    Parsed files are cached; each call returns its own copy so callers can
+    modify the result without affecting later loads.
+    """
+    return copy.deepcopy(_read_config(str(path)))
+
+
+__all__ = ["load_config"]
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+
+from .model import DIFFICULTIES, DIFFICULTY_COLUMNS, encode_features
+
+try:
+    import pyarrow  # noqa: F401
+
+    _CSV_ENGINE = "pyarrow"
+except ImportError:  # pragma: no cover - fall back to pandas' C parser
+    _CSV_ENGINE = "c"
 
 
 @dataclass(frozen=True)
 class DatasetSplits:
-    """Container for train/test splits."""
+    """Container for train/test splits.
 
-    X_train: pd.DataFrame
-    X_test: pd.DataFrame
-    y_train: pd.Series
-    y_test: pd.Series
+    Splits hold DataFrames/Series or plain ndarrays depending on what was
+    split; ``feature_names`` records the column order for ndarray splits.
+    """
+
+    X_train: Union[pd.DataFrame, np.ndarray]
+    X_test: Union[pd.DataFrame, np.ndarray]
+    y_train: Union[pd.Series, np.ndarray]
+    y_test: Union[pd.Series, np.ndarray]
+    feature_names: Optional[List[str]] = None
 
 
 def _ensure_columns_exist(df: pd.DataFrame, required_columns: Sequence[str]) -> None:
@@ -34,7 +50,11 @@ def load_csv(data_path: Union[str, Path]) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Dataset not found at: {path}")
 
-    df = pd.read_csv(path)
+    # Multi-threaded pyarrow parser when available; difficulty is read as a
+    # categorical so the one-hot step works on codes instead of strings
+    df = pd.read_csv(
+        path, engine=_CSV_ENGINE, dtype={"exam_difficulty": "category"}
+    )
     if df.empty:
         raise ValueError("Loaded dataset is empty.")
     return df
@@ -49,8 +69,8 @@ def prepare_features_and_target(df: pd.DataFrame,
 ) -> Tuple[pd.DataFrame, pd.Series]:
     """Split a DataFrame into features X and target y.
 
-    This function validates column presence and returns copies to avoid
-    accidental mutation of the original DataFrame.
+    This function validates column presence and never mutates the original
+    DataFrame; columns that are already numeric are used as-is.
     """
     # Default to a two-feature setup if not provided, per the updated dataset
     if feature_columns is None:
@@ -63,48 +83,95 @@ def prepare_features_and_target(df: pd.DataFrame,
     required_columns: List[str] = list(feature_columns) + [target_column]
     _ensure_columns_exist(df, required_columns)
 
-    X = df[list(feature_columns)].copy()
-    y = df[target_column].copy()
+    X = df[list(feature_columns)]
+    y = df[target_column]
+    # Indicator columns created below are numeric by construction, so only
+    # the original feature columns need coercion and NaN checks
+    numeric_cols = [col for col in feature_columns if col != "exam_difficulty"]
 
     # Treat hours_studied as a numeric decimal value in hours
 
     # One-hot encode exam_difficulty (Easy/Medium/Hard)
     if "exam_difficulty" in X.columns:
-        categories = ["Easy", "Medium", "Hard"]
-        X.loc[:, "exam_difficulty"] = pd.Categorical(
-            X["exam_difficulty"], categories=categories
-        )
-        dummies = pd.get_dummies(
-            X["exam_difficulty"], prefix="difficulty", dtype=float
-        )
-        X = X.drop(columns=["exam_difficulty"]).join(dummies)
+        # Fill all indicator columns in one allocation; unknown values
+        # (code -1) leave their row all zeros
+        codes = pd.Index(DIFFICULTIES).get_indexer(X["exam_difficulty"])
+        one_hot = encode_features(None, codes, DIFFICULTY_COLUMNS, dtype=np.int8)
+        X = X.drop(columns=["exam_difficulty"])
+        X[DIFFICULTY_COLUMNS] = one_hot
 
-    # Coerce numerics and drop rows with NaNs
-    numeric_cols = X.columns
-    X.loc[:, numeric_cols] = X[numeric_cols].apply(pd.to_numeric, errors="coerce")
-    y = pd.to_numeric(y, errors="coerce")
-    valid_mask = X.notna().all(axis=1) & y.notna()
+    # Coerce non-numeric columns and drop rows with NaNs
+    for col in numeric_cols:
+        if not pd.api.types.is_numeric_dtype(X[col]):
+            X[col] = pd.to_numeric(X[col], errors="coerce")
+    if not pd.api.types.is_numeric_dtype(y):
+        y = pd.to_numeric(y, errors="coerce")
+    valid_mask = X[numeric_cols].notna().all(axis=1) & y.notna()
     if not valid_mask.all():
         X = X[valid_mask]
         y = y[valid_mask]
 
+    # Narrow continuous values to float32; indicators are already int8
+    X = X.astype({col: np.float32 for col in numeric_cols})
+    y = y.astype(np.float32)
+
     return X, y
 
 
+def prepare_features_and_target_np(
+    df: pd.DataFrame,
+    feature_columns: Union[str, Sequence[str], None] = None,
+    target_column: str = "score",
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """Like :func:`prepare_features_and_target`, but return plain arrays.
+
+    Returns a float32 feature matrix, a float32 target vector and the feature
+    names in column order, ready to pass straight to scikit-learn.
+    """
+    X, y = prepare_features_and_target(df, feature_columns, target_column)
+    return X.to_numpy(dtype=np.float32), y.to_numpy(dtype=np.float32), list(X.columns)
+
+
 def split_train_test(
-    X: pd.DataFrame,
-    y: pd.Series,
+    X: Union[pd.DataFrame, np.ndarray],
+    y: Union[pd.Series, np.ndarray],
     test_size: float = 0.2,
     random_state: int = 42,
+    feature_names: Optional[List[str]] = None,
 ) -> DatasetSplits:
     """Split features and target into train/test sets.
 
+    Rows are shuffled with a single seeded permutation; like scikit-learn's
+    ``train_test_split``, the test set gets ``ceil(test_size * n)`` rows.
     For regression problems we do not stratify by default.
     """
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=test_size, random_state=random_state
+    if feature_names is None and isinstance(X, pd.DataFrame):
+        feature_names = list(X.columns)
+
+    n_samples = len(X)
+    n_test = math.ceil(test_size * n_samples)
+    if not 0 < n_test < n_samples:
+        raise ValueError(
+            f"test_size={test_size} with {n_samples} samples leaves an empty "
+            "train or test set."
+        )
+
+    idx = np.random.default_rng(random_state).permutation(n_samples)
+    train_idx, test_idx = idx[n_test:], idx[:n_test]
+    return DatasetSplits(
+        X_train=_take_rows(X, train_idx),
+        X_test=_take_rows(X, test_idx),
+        y_train=_take_rows(y, train_idx),
+        y_test=_take_rows(y, test_idx),
+        feature_names=feature_names,
     )
-    return DatasetSplits(X_train=X_train, X_test=X_test, y_train=y_train, y_test=y_test)
+
+
+def _take_rows(data: Union[pd.DataFrame, pd.Series, np.ndarray], idx: np.ndarray):
+    """Select rows by position from a pandas object or an ndarray."""
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.iloc[idx]
+    return data[idx]
 
 
 def load_data_pipeline(
@@ -114,18 +181,94 @@ def load_data_pipeline(
     test_size: float = 0.2,
     random_state: int = 42,
 ) -> DatasetSplits:
-    """Convenience function: load CSV → prepare X/y → split train/test."""
+    """Convenience function: load CSV → prepare X/y → split train/test.
+
+    Splits are float32 ndarrays with column order in ``feature_names``. The
+    prepared arrays are cached per file modification time, so repeated calls
+    in one process skip re-parsing and re-encoding an unchanged dataset.
+    """
+    path = Path(data_path)
+    mtime = path.stat().st_mtime if path.exists() else 0.0
+    if isinstance(feature_columns, str):
+        feature_columns = [feature_columns]
+    cols_key = tuple(feature_columns) if feature_columns is not None else None
+    X, y, feature_names = _prepare_cached(str(path), mtime, cols_key, target_column)
+    return split_train_test(
+        X,
+        y,
+        test_size=test_size,
+        random_state=random_state,
+        feature_names=list(feature_names),
+    )
+
+
+def load_data_pipeline_chunked(
+    data_path: Union[str, Path],
+    feature_columns: Union[str, Sequence[str], None] = None,
+    target_column: str = "score",
+    test_size: float = 0.2,
+    random_state: int = 42,
+    chunksize: int = 200_000,
+) -> DatasetSplits:
+    """Like :func:`load_data_pipeline`, but parse the CSV ``chunksize`` rows at a time.
+
+    Each chunk is encoded to float32 arrays before the next one is read, so
+    the raw text columns of the whole file are never held in memory at once.
+    The one-hot encoding uses fixed categories, so chunks encode consistently.
+    """
+    path = Path(data_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Dataset not found at: {path}")
+
+    X_parts: List[np.ndarray] = []
+    y_parts: List[np.ndarray] = []
+    feature_names: List[str] = []
+    # pyarrow's engine does not support chunked reads, so use the C parser
+    with pd.read_csv(
+        path, chunksize=chunksize, dtype={"exam_difficulty": "category"}
+    ) as reader:
+        for chunk in reader:
+            X_chunk, y_chunk, feature_names = prepare_features_and_target_np(
+                chunk, feature_columns, target_column
+            )
+            X_parts.append(X_chunk)
+            y_parts.append(y_chunk)
+
+    if not X_parts or not any(len(part) for part in y_parts):
+        raise ValueError("Loaded dataset is empty.")
+    return split_train_test(
+        np.concatenate(X_parts),
+        np.concatenate(y_parts),
+        test_size=test_size,
+        random_state=random_state,
+        feature_names=feature_names,
+    )
+
+
+@lru_cache(maxsize=4)
+def _prepare_cached(
+    data_path: str,
+    mtime: float,
+    cols_key: Optional[Tuple[str, ...]],
+    target_column: str,
+) -> Tuple[np.ndarray, np.ndarray, Tuple[str, ...]]:
+    """Load and encode a dataset; ``mtime`` only keys the cache."""
     df = load_csv(data_path)
-    X, y = prepare_features_and_target(df, feature_columns, target_column)
-    return split_train_test(X, y, test_size=test_size, random_state=random_state)
+    X, y, feature_names = prepare_features_and_target_np(df, cols_key, target_column)
+    # Cached arrays are shared between callers, so guard them against writes
+    X.flags.writeable = False
+    y.flags.writeable = False
+    return X, y, tuple(feature_names)
 
 
 __all__ = [
     "DatasetSplits",
     "load_csv",
     "prepare_features_and_target",
+    "prepare_features_and_target_np",
     "split_train_test",
     "load_data_pipeline",
+    "load_data_pipeline_chunked",
 ]
 
 
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
 import sys
+from typing import Sequence
 
-import joblib
-import yaml
+import numpy as np
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
+from .config import load_config
 from .data import load_data_pipeline
+from .model import load_artifact
 
 
 def parse_args() -> argparse.Namespace:
@@ -22,12 +23,15 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def load_config(path: str | Path) -> dict:
-    cfg_path = Path(path)
-    if not cfg_path.exists():
-        raise FileNotFoundError(f"Config not found: {cfg_path}")
-    with cfg_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+def align_features(
+    X: np.ndarray, columns: Sequence[str], feature_names: Sequence[str]
+) -> np.ndarray:
+    """Reorder the columns of ``X`` (named by ``columns``) to ``feature_names``."""
+    index = {name: i for i, name in enumerate(columns)}
+    missing = [name for name in feature_names if name not in index]
+    if missing:
+        raise ValueError(f"Test data is missing model features: {missing}")
+    return np.asarray(X)[:, [index[name] for name in feature_names]]
 
 
 def main() -> None:
@@ -39,7 +43,7 @@ def main() -> None:
     random_state = int(cfg.get("random_state", 42))
     target = cfg.get("target", "score")
     feature = cfg.get("feature")
-    model_path = cfg.get("model_path", "models/model.joblib")
+    model_path = cfg.get("model_path", "models/model.npz")
 
     feature_columns = None
     if feature is not None:
@@ -53,10 +57,13 @@ def main() -> None:
         random_state=random_state,
     )
 
-    artifact = joblib.load(model_path)
-    model = artifact["model"] if isinstance(artifact, dict) else artifact
+    artifact = load_artifact(model_path)
+    model = artifact["model"]
+    X_test = align_features(
+        splits.X_test, splits.feature_names, artifact["feature_names"]
+    )
 
-    preds = model.predict(splits.X_test)
+    preds = model.predict(X_test)
     mae = mean_absolute_error(splits.y_test, preds)
     mse = mean_squared_error(splits.y_test, preds)
     rmse = mse ** 0.5  # Calculate RMSE manually for compatibility
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import joblib
+import numpy as np
+
+# Exam difficulty levels, in the alphabetical order of their indicator columns
+# (the order pd.get_dummies produced, which saved models were trained on)
+DIFFICULTIES = ("Easy", "Hard", "Medium")
+DIFFICULTY_COLUMNS = [f"difficulty_{d}" for d in DIFFICULTIES]
+# Feature order used when neither the artifact nor the estimator records its
+# feature names; matches the columns produced by src/data.py
+DEFAULT_FEATURE_NAMES = ["hours_studied"] + DIFFICULTY_COLUMNS
+
+
+@dataclass(frozen=True)
+class LinearPredictor:
+    """Linear model restored from saved coefficients, without sklearn."""
+
+    coef_: np.ndarray
+    intercept_: float
+    feature_names: List[str]
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Return ``X @ coef_ + intercept_`` for a 2-D feature array."""
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
+
+
+def difficulty_codes(difficulties: Sequence[str]) -> np.ndarray:
+    """Position of each difficulty in :data:`DIFFICULTIES`, -1 if unknown."""
+    lookup = {d: i for i, d in enumerate(DIFFICULTIES)}
+    return np.fromiter(
+        (lookup.get(d, -1) for d in difficulties),
+        dtype=np.int64,
+        count=len(difficulties),
+    )
+
+
+def difficulty_feature_columns(feature_names: Sequence[str]) -> np.ndarray:
+    """Column of each difficulty's indicator in ``feature_names``, -1 if absent."""
+    index = {name: i for i, name in enumerate(feature_names)}
+    return np.array([index.get(col, -1) for col in DIFFICULTY_COLUMNS], dtype=np.int64)
+
+
+def encode_features(
+    hours: Optional[Any],
+    codes: np.ndarray,
+    feature_names: Sequence[str],
+    dtype: Any = np.float64,
+) -> np.ndarray:
+    """Build an ``(n, len(feature_names))`` matrix of hours and one-hot difficulty.
+
+    ``codes`` come from :func:`difficulty_codes`; rows with code -1 get no
+    indicator set. Columns follow ``feature_names``, and features the model was
+    not trained on are skipped. ``hours`` may be None to leave it at zero.
+    """
+    codes = np.asarray(codes)
+    X = np.zeros((len(codes), len(feature_names)), dtype=dtype)
+    if hours is not None and "hours_studied" in feature_names:
+        X[:, list(feature_names).index("hours_studied")] = hours
+    rows = np.flatnonzero(codes >= 0)
+    cols = difficulty_feature_columns(feature_names)[codes[rows]]
+    present = cols >= 0
+    X[rows[present], cols[present]] = 1
+    return X
+
+
+def save_artifact(
+    model: Any,
+    feature_names: Sequence[str],
+    model_path: Union[str, Path],
+) -> Path:
+    """Save a fitted linear model.
+
+    ``.npz`` paths store only the coefficients, intercept and feature names;
+    any other suffix pickles the full estimator with joblib, uncompressed so
+    that :func:`load_artifact` can memory-map its arrays.
+    """
+    path = Path(model_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".npz":
+        np.savez(
+            path,
+            coef=np.asarray(model.coef_, dtype=np.float32),
+            intercept=np.float32(model.intercept_),
+            feature_names=np.array(list(feature_names)),
+        )
+    else:
+        joblib.dump(
+            {"model": model, "feature_names": list(feature_names)}, path, compress=0
+        )
+    return path
+
+
+def load_artifact(model_path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a model artifact as ``{"model": ..., "feature_names": ...}``.
+
+    ``.npz`` files are restored as a :class:`LinearPredictor`; anything else
+    is treated as a joblib pickle, as written by older versions of train.py.
+    Joblib arrays are memory-mapped read-only, so workers forked from a
+    preloading server (``gunicorn --preload``) share one copy of them.
+
+    When a joblib artifact does not record feature names, they are taken from
+    the estimator's ``feature_names_in_`` or else :data:`DEFAULT_FEATURE_NAMES`.
+    """
+    path = Path(model_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Model not found at {path}. Train the model first.")
+
+    if path.suffix == ".npz":
+        with np.load(path) as data:
+            feature_names = [str(name) for name in data["feature_names"]]
+            model = LinearPredictor(
+                coef_=data["coef"].astype(np.float64),
+                intercept_=float(data["intercept"]),
+                feature_names=feature_names,
+            )
+        return {"model": model, "feature_names": feature_names}
+
+    artifact = joblib.load(path, mmap_mode="r")
+    if not isinstance(artifact, dict):
+        artifact = {"model": artifact, "feature_names": None}
+    if artifact.get("feature_names") is None:
+        # Bare estimators fitted on a DataFrame still know their columns
+        names_in = getattr(artifact["model"], "feature_names_in_", None)
+        artifact["feature_names"] = (
+            list(names_in) if names_in is not None else list(DEFAULT_FEATURE_NAMES)
+        )
+    return artifact
+
+
+__all__ = [
+    "DIFFICULTIES",
+    "DIFFICULTY_COLUMNS",
+    "DEFAULT_FEATURE_NAMES",
+    "LinearPredictor",
+    "difficulty_codes",
+    "difficulty_feature_columns",
+    "encode_features",
+    "save_artifact",
+    "load_artifact",
+]
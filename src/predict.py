@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
 import sys
 
-import joblib
-import pandas as pd
-import yaml
+import numpy as np
+
+from .config import load_config
+from .model import DIFFICULTIES, difficulty_codes, encode_features, load_artifact
 
 
 def parse_args() -> argparse.Namespace:
@@ -17,60 +17,75 @@ def parse_args() -> argparse.Namespace:
         default="configs/config.yaml",
         help="Path to YAML config file",
     )
-    parser.add_argument(
+    hours_group = parser.add_mutually_exclusive_group(required=True)
+    hours_group.add_argument(
         "--hours",
         type=float,
-        required=True,
         help="Hours studied as a decimal (e.g., 4.5)",
     )
+    hours_group.add_argument(
+        "--hours-file",
+        type=str,
+        help="CSV file with one hours-studied value per line",
+    )
     parser.add_argument(
         "--difficulty",
         type=str,
-        choices=["Easy", "Medium", "Hard"],
+        choices=list(DIFFICULTIES),
         default="Medium",
         help="Exam difficulty category",
     )
-    return parser.parse_args()
-
-
-def load_config(path: str | Path) -> dict:
-    cfg_path = Path(path)
-    if not cfg_path.exists():
-        raise FileNotFoundError(f"Config not found: {cfg_path}")
-    with cfg_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    parser.add_argument(
+        "--difficulty-file",
+        type=str,
+        help="CSV file with one difficulty per line, matching --hours-file "
+        "(defaults to --difficulty for every row)",
+    )
+    args = parser.parse_args()
+    if args.difficulty_file is not None and args.hours_file is None:
+        parser.error("--difficulty-file requires --hours-file")
+    return args
 
 
 def main() -> None:
     args = parse_args()
     cfg = load_config(args.config)
 
-    model_path = cfg.get("model_path", "models/model.joblib")
-
-    artifact = joblib.load(model_path)
-    model = artifact["model"] if isinstance(artifact, dict) else artifact
-    feature_names = (
-        artifact.get("feature_names", None) if isinstance(artifact, dict) else None
-    )
-
-    # Construct a single-row feature frame matching training features
-    base = {
-        "hours_studied": args.hours,
-        "difficulty_Easy": 1.0 if args.difficulty == "Easy" else 0.0,
-        "difficulty_Medium": 1.0 if args.difficulty == "Medium" else 0.0,
-        "difficulty_Hard": 1.0 if args.difficulty == "Hard" else 0.0,
-    }
-    X = pd.DataFrame([base])
-
-    if feature_names is not None:
-        # Add any missing columns as zeros and order columns to match training
-        for col in feature_names:
-            if col not in X.columns:
-                X[col] = 0.0
-        X = X[feature_names]
-
-    pred = float(model.predict(X)[0])
-    print(f"Predicted score: {pred:.2f}")
+    model_path = cfg.get("model_path", "models/model.npz")
+
+    artifact = load_artifact(model_path)
+    model = artifact["model"]
+    feature_names = artifact["feature_names"]
+
+    if args.hours_file is None:
+        X = encode_features(
+            [args.hours], difficulty_codes([args.difficulty]), feature_names
+        )
+        pred = float(model.predict(X)[0])
+        print(f"Predicted score: {pred:.2f}")
+        return
+
+    hours = np.loadtxt(args.hours_file, delimiter=",", usecols=0, ndmin=1)
+    if args.difficulty_file is not None:
+        difficulties = np.loadtxt(
+            args.difficulty_file, dtype=str, delimiter=",", usecols=0, ndmin=1
+        )
+    else:
+        difficulties = np.full(len(hours), args.difficulty)
+
+    if len(difficulties) != len(hours):
+        raise ValueError(
+            f"{len(hours)} hours values but {len(difficulties)} difficulties"
+        )
+    codes = difficulty_codes(difficulties)
+    if (codes < 0).any():
+        unknown = sorted(set(difficulties[codes < 0]))
+        raise ValueError(f"Unknown exam difficulty: {', '.join(unknown)}")
+
+    # Score every row with a single predict call
+    preds = model.predict(encode_features(hours, codes, feature_names))
+    for pred in preds:
+        print(f"{pred:.2f}")
 
 
 if __name__ == "__main__":
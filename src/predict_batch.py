@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from .model import difficulty_codes, difficulty_feature_columns
+
+
+def _score_batch_numpy(
+    hours: np.ndarray,
+    diff_cols: np.ndarray,
+    coef: np.ndarray,
+    hours_idx: int,
+    intercept: float,
+) -> np.ndarray:
+    """Vectorized fallback for :func:`_score_batch` when numba is missing."""
+    out = np.full(hours.shape[0], intercept, dtype=np.float64)
+    if hours_idx >= 0:
+        out += coef[hours_idx] * hours
+    known = diff_cols >= 0
+    out[known] += coef[diff_cols[known]]
+    return np.clip(out, 0.0, 100.0)
+
+
+try:
+    from numba import njit
+
+    # Not parallel=True: batches are request-sized, and numba's fallback
+    # workqueue threading layer aborts when called from concurrent threads
+    # such as gunicorn's gthread workers. No fastmath either: it assumes finite
+    # inputs, which would make NaN handling differ from the numpy fallback
+    @njit(cache=True)
+    def _score_batch(hours, diff_cols, coef, hours_idx, intercept):
+        """Linear score for each row, clamped to 0-100.
+
+        ``diff_cols[i]`` is the coefficient index of row i's difficulty
+        indicator, or -1 when the model has no column for it.
+        """
+        n = hours.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            v = intercept
+            if hours_idx >= 0:
+                v += coef[hours_idx] * hours[i]
+            if diff_cols[i] >= 0:
+                v += coef[diff_cols[i]]
+            if v < 0.0:
+                v = 0.0
+            elif v > 100.0:
+                v = 100.0
+            out[i] = v
+        return out
+
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    _score_batch = _score_batch_numpy
+
+
+def predict_scores(
+    hours: Sequence[float],
+    difficulties: Sequence[str],
+    coef: np.ndarray,
+    intercept: float,
+    feature_names: Sequence[str],
+) -> np.ndarray:
+    """Predict clamped scores for many (hours, difficulty) pairs at once.
+
+    ``feature_names`` gives the training feature for each entry of ``coef``;
+    features the model was not trained on are ignored.
+    """
+    # Trailing -1 so unknown difficulties (code -1) map to "no column"
+    columns = np.append(difficulty_feature_columns(feature_names), -1)
+    hours_idx = (
+        list(feature_names).index("hours_studied")
+        if "hours_studied" in feature_names
+        else -1
+    )
+    return _score_batch(
+        np.asarray(hours, dtype=np.float64),
+        columns[difficulty_codes(difficulties)],
+        np.asarray(coef, dtype=np.float64),
+        hours_idx,
+        float(intercept),
+    )
+
+
+__all__ = [
+    "predict_scores",
+]
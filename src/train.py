@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
 import sys
 
-import joblib
-import yaml
 from sklearn.linear_model import LinearRegression
 
+from .config import load_config
 from .data import load_data_pipeline
+from .model import save_artifact
 
 
 def parse_args() -> argparse.Namespace:
@@ -22,14 +21,6 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def load_config(path: str | Path) -> dict:
-    cfg_path = Path(path)
-    if not cfg_path.exists():
-        raise FileNotFoundError(f"Config not found: {cfg_path}")
-    with cfg_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
-
-
 def main() -> None:
     args = parse_args()
     cfg = load_config(args.config)
@@ -39,7 +30,7 @@ def main() -> None:
     random_state = int(cfg.get("random_state", 42))
     target = cfg.get("target", "score")
     feature = cfg.get("feature")
-    model_path = cfg.get("model_path", "models/model.joblib")
+    model_path = cfg.get("model_path", "models/model.npz")
 
     feature_columns = None
     if feature is not None:
@@ -57,15 +48,8 @@ def main() -> None:
     model = LinearRegression()
     model.fit(splits.X_train, splits.y_train)
 
-    # Attach feature names for consistent inference later
-    artifact = {
-        "model": model,
-        "feature_names": list(splits.X_train.columns),
-    }
-
-    model_out = Path(model_path)
-    model_out.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(artifact, model_out)
+    # Store feature names with the coefficients for consistent inference later
+    model_out = save_artifact(model, splits.feature_names, model_path)
     print(f"Saved model to {model_out}")
 
 
@@ -7,7 +7,13 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+import joblib
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+import src.app as app_module
 from src.app import app
+from src.data import prepare_features_and_target
 
 
 @pytest.fixture
@@ -18,6 +24,65 @@ def client():
         yield client
 
 
+@pytest.fixture
+def reload_model(monkeypatch):
+    """Load a different artifact, restoring the app's model state afterwards."""
+    for name in ["MODEL_ARTIFACT", "FEATURE_NAMES", "HOURS_IDX",
+                 "FEATURE_TEMPLATES", "MODEL_COEF", "MODEL_INTERCEPT"]:
+        monkeypatch.setattr(app_module, name, getattr(app_module, name))
+    monkeypatch.setattr(app_module, "MODEL_ARTIFACT", None)
+    monkeypatch.setattr(app_module, "MODEL_COEF", None)
+    return app_module.load_model
+
+
+@pytest.fixture
+def training_data():
+    """Features and target prepared from the repo dataset."""
+    df = pd.read_csv(project_root / "datasets" / "student_scores_dataset.csv")
+    return prepare_features_and_target(df)
+
+
+def _predict_hard_5h(client):
+    response = client.post('/predict', json={
+        'hours_studied': 5.0,
+        'exam_difficulty': 'Hard'
+    })
+    assert response.status_code == 200
+    return json.loads(response.data)['predicted_score']
+
+
+def test_predict_bare_estimator_uses_fitted_feature_names(
+    client, reload_model, training_data, tmp_path
+):
+    """Test a bare estimator is scored in the column order it was fitted on."""
+    X, y = training_data
+    X = X[["difficulty_Medium", "hours_studied", "difficulty_Hard",
+           "difficulty_Easy"]]
+    model = LinearRegression().fit(X, y)
+    joblib.dump(model, tmp_path / "bare.joblib")
+    reload_model(str(tmp_path / "bare.joblib"))
+
+    row = pd.DataFrame([[0.0, 5.0, 1.0, 0.0]], columns=X.columns)
+    assert _predict_hard_5h(client) == round(float(model.predict(row)[0]), 2)
+
+
+def test_predict_bare_estimator_default_order(
+    client, reload_model, training_data, tmp_path
+):
+    """Test the default feature order matches the data pipeline's columns."""
+    X, y = training_data
+    model = LinearRegression().fit(X.to_numpy(), y)
+    joblib.dump(model, tmp_path / "bare.joblib")
+    reload_model(str(tmp_path / "bare.joblib"))
+
+    row = X.iloc[:1].copy()
+    row.loc[:, :] = 0
+    row["hours_studied"] = 5.0
+    row["difficulty_Hard"] = 1
+    expected = round(float(model.predict(row.to_numpy())[0]), 2)
+    assert _predict_hard_5h(client) == expected
+
+
 def test_health_check(client):
     """Test the health check endpoint."""
     response = client.get('/health')
@@ -37,6 +102,26 @@ def test_predict_missing_data(client):
     assert 'error' in data
 
 
+def test_predict_malformed_json(client):
+    """Test predict endpoint with a body that is not valid JSON."""
+    response = client.post(
+        '/predict', data='{"hours_studied": ', content_type='application/json'
+    )
+    assert response.status_code == 400
+
+    data = json.loads(response.data)
+    assert data['error'] == 'Invalid JSON'
+
+
+def test_predict_non_object_body(client):
+    """Test predict endpoint with a JSON array instead of an object."""
+    response = client.post('/predict', json=[5.0, 'Medium'])
+    assert response.status_code == 400
+
+    data = json.loads(response.data)
+    assert 'error' in data
+
+
 def test_predict_invalid_hours(client):
     """Test predict endpoint with invalid hours."""
     response = client.post('/predict', json={
@@ -49,6 +134,19 @@ def test_predict_invalid_hours(client):
     assert 'error' in data
 
 
+@pytest.mark.parametrize('hours', ['nan', 'inf', '-inf', '1e400'])
+def test_predict_non_finite_hours(client, hours):
+    """Test predict endpoint rejects hours that are not finite."""
+    response = client.post('/predict', json={
+        'hours_studied': hours,
+        'exam_difficulty': 'Medium'
+    })
+    assert response.status_code == 400
+
+    data = json.loads(response.data)
+    assert 'finite' in data['error']
+
+
 def test_predict_invalid_difficulty(client):
     """Test predict endpoint with invalid difficulty."""
     response = client.post('/predict', json={
@@ -79,6 +177,87 @@ def test_predict_with_model(client):
         assert 'error' in data
 
 
+def test_predict_batch_rejects_non_array(client):
+    """Test batch endpoint with a JSON object instead of an array."""
+    response = client.post('/predict_batch', json={'hours_studied': 5.0})
+    assert response.status_code == 400
+
+    data = json.loads(response.data)
+    assert 'error' in data
+
+
+def test_predict_batch_invalid_item(client):
+    """Test batch endpoint reports the index of an invalid item."""
+    response = client.post('/predict_batch', json=[
+        {'hours_studied': 5.0, 'exam_difficulty': 'Easy'},
+        {'hours_studied': 'invalid', 'exam_difficulty': 'Easy'},
+    ])
+    assert response.status_code == 400
+
+    data = json.loads(response.data)
+    assert data['error'].startswith('Item 1:')
+
+
+@pytest.mark.parametrize('hours', ['nan', 'inf', '1e400'])
+def test_predict_batch_non_finite_hours(client, hours):
+    """Test batch endpoint rejects hours that are not finite."""
+    response = client.post('/predict_batch', json=[
+        {'hours_studied': 5.0, 'exam_difficulty': 'Easy'},
+        {'hours_studied': hours, 'exam_difficulty': 'Easy'},
+    ])
+    assert response.status_code == 400
+
+    data = json.loads(response.data)
+    assert data['error'] == 'Item 1: hours_studied must be a finite number'
+
+
+def test_predict_batch_rejects_oversized_array(client, monkeypatch):
+    """Test batch endpoint refuses arrays above MAX_BATCH_SIZE."""
+    monkeypatch.setattr(app_module, "MAX_BATCH_SIZE", 2)
+    response = client.post('/predict_batch', json=[
+        {'hours_studied': 1.0}, {'hours_studied': 2.0}, {'hours_studied': 3.0}
+    ])
+    assert response.status_code == 413
+
+    data = json.loads(response.data)
+    assert 'error' in data
+
+
+def test_predict_batch_rejects_oversized_body(client, monkeypatch):
+    """Test request bodies above MAX_CONTENT_LENGTH are refused unread."""
+    monkeypatch.setitem(app.config, "MAX_CONTENT_LENGTH", 64)
+    response = client.post('/predict_batch', json=[
+        {'hours_studied': 1.0}, {'hours_studied': 2.0}, {'hours_studied': 3.0}
+    ])
+    assert response.status_code == 413
+
+    data = json.loads(response.data)
+    assert data['error'] == 'Request body too large'
+
+
+def test_predict_batch_matches_single_predictions(client):
+    """Test batch predictions agree with /predict (if a model is available)."""
+    inputs = [
+        {'hours_studied': 5.0, 'exam_difficulty': 'Medium'},
+        {'hours_studied': 2.5, 'exam_difficulty': 'Hard'},
+        {'hours_studied': 8.0, 'exam_difficulty': 'Easy'},
+    ]
+    response = client.post('/predict_batch', json=inputs)
+
+    # Should either succeed (200) or fail due to missing model (500)
+    assert response.status_code in [200, 500]
+
+    data = json.loads(response.data)
+    if response.status_code == 200:
+        singles = [
+            json.loads(client.post('/predict', json=item).data)['predicted_score']
+            for item in inputs
+        ]
+        assert data['predicted_scores'] == singles
+    else:
+        assert 'error' in data
+
+
 def test_model_info_with_model(client):
     """Test model info endpoint with valid model (if available)."""
     response = client.get('/model_info')
@@ -91,3 +270,11 @@ def test_model_info_with_model(client):
         assert 'model_type' in data
     else:
         assert 'error' in data
+
+
+def test_json_responses_are_compact(client):
+    """Test that JSON responses are serialized without pretty printing."""
+    response = client.get('/health')
+    assert response.mimetype == 'application/json'
+    assert b'\n  ' not in response.data
+    assert b'": "' not in response.data
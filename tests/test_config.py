@@ -0,0 +1,27 @@
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import load_config
+
+
+def test_load_config_returns_independent_copies(tmp_path):
+    """Test that mutating a loaded config does not leak into later loads."""
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("test_size: 0.2\nfeature: [hours_studied]\n")
+
+    cfg = load_config(cfg_path)
+    cfg["test_size"] = 0.5
+    cfg["feature"].append("exam_difficulty")
+
+    assert load_config(cfg_path) == {"test_size": 0.2, "feature": ["hours_studied"]}
+
+
+def test_load_config_missing_file(tmp_path):
+    """Test that a missing config raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        load_config(tmp_path / "missing.yaml")
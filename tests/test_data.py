@@ -1,4 +1,6 @@
+import os
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import sys
@@ -7,7 +9,14 @@ import sys
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.data import load_csv, prepare_features_and_target, split_train_test
+from src.data import (
+    load_csv,
+    load_data_pipeline,
+    load_data_pipeline_chunked,
+    prepare_features_and_target,
+    prepare_features_and_target_np,
+    split_train_test,
+)
 
 
 def test_load_csv():
@@ -43,17 +52,35 @@ def test_prepare_features_and_target():
     
     # Check that hours_studied is preserved as numeric
     assert "hours_studied" in X.columns
-    assert X["hours_studied"].dtype in ["float64", "int64"]
+    assert X["hours_studied"].dtype == "float32"
     
     # Check that exam_difficulty is one-hot encoded
     assert "difficulty_Easy" in X.columns
     assert "difficulty_Medium" in X.columns
     assert "difficulty_Hard" in X.columns
     assert "exam_difficulty" not in X.columns
+    assert X["difficulty_Easy"].dtype == "int8"
     
     # Check target
     assert len(y) == 3
-    assert y.dtype in ["float64", "int64"]
+    assert y.dtype == "float32"
+
+
+def test_prepare_features_and_target_np():
+    """Test that the ndarray variant matches the DataFrame output."""
+    df = pd.DataFrame({
+        "hours_studied": [4.37, 9.56, 7.59],
+        "exam_difficulty": ["Easy", "Medium", "Hard"],
+        "score": [60.2, 100.0, 93.9]
+    })
+
+    X_np, y_np, feature_names = prepare_features_and_target_np(df)
+    X, y = prepare_features_and_target(df)
+
+    assert feature_names == list(X.columns)
+    assert X_np.dtype == "float32" and X_np.shape == (3, 4)
+    assert (X_np == X.to_numpy(dtype="float32")).all()
+    assert (y_np == y.to_numpy()).all()
 
 
 def test_split_train_test():
@@ -75,3 +102,101 @@ def test_split_train_test():
     # Check that test size is approximately correct
     expected_test_size = len(X) * 0.2
     assert abs(len(splits.X_test) - expected_test_size) <= 1
+
+
+def test_prepare_features_one_hot_values():
+    """Test that each row sets exactly its own difficulty indicator."""
+    df = pd.DataFrame({
+        "hours_studied": [1.0, 2.0, 3.0, 4.0],
+        "exam_difficulty": ["Hard", "Easy", "Medium", "Unknown"],
+        "score": [10.0, 20.0, 30.0, 40.0]
+    })
+
+    X, _ = prepare_features_and_target(df)
+
+    one_hot = X[["difficulty_Easy", "difficulty_Medium", "difficulty_Hard"]]
+    assert one_hot.values.tolist() == [
+        [0, 0, 1],
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 0],
+    ]
+
+
+def test_prepare_features_column_order():
+    """Test that feature columns keep the order saved models were trained on."""
+    df = pd.DataFrame({
+        "hours_studied": [1.0, 2.0, 3.0],
+        "exam_difficulty": ["Easy", "Medium", "Hard"],
+        "score": [10.0, 20.0, 30.0]
+    })
+
+    X, _ = prepare_features_and_target(df)
+
+    assert list(X.columns) == [
+        "hours_studied",
+        "difficulty_Easy",
+        "difficulty_Hard",
+        "difficulty_Medium",
+    ]
+
+
+def test_load_data_pipeline_reloads_modified_file(tmp_path):
+    """Test that cached pipeline results are invalidated when the CSV changes."""
+    csv_path = tmp_path / "scores.csv"
+    df = pd.DataFrame({
+        "hours_studied": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "exam_difficulty": ["Easy", "Medium", "Hard", "Easy", "Medium"],
+        "score": [10.0, 20.0, 30.0, 40.0, 50.0]
+    })
+    df.to_csv(csv_path, index=False)
+
+    first = load_data_pipeline(csv_path)
+    again = load_data_pipeline(csv_path)
+    assert len(first.X_train) + len(first.X_test) == 5
+    assert again.feature_names == first.feature_names
+    assert (again.X_train == first.X_train).all()
+
+    pd.concat([df, df]).to_csv(csv_path, index=False)
+    stat = csv_path.stat()
+    os.utime(csv_path, (stat.st_atime, stat.st_mtime + 10))
+
+    reloaded = load_data_pipeline(csv_path)
+    assert len(reloaded.X_train) + len(reloaded.X_test) == 10
+
+
+def test_split_train_test_is_seeded_permutation():
+    """Test that splits partition the rows and are reproducible per seed."""
+    X = np.arange(20, dtype=np.float32).reshape(10, 2)
+    y = np.arange(10, dtype=np.float32)
+
+    splits = split_train_test(X, y, test_size=0.25, random_state=7)
+    again = split_train_test(X, y, test_size=0.25, random_state=7)
+
+    assert len(splits.y_test) == 3
+    assert sorted(np.concatenate([splits.y_train, splits.y_test])) == list(y)
+    assert (splits.X_train[:, 0] == splits.y_train * 2).all()
+    assert (again.y_test == splits.y_test).all()
+
+
+def test_split_train_test_rejects_empty_split():
+    """Test that a split leaving no training rows raises ValueError."""
+    with pytest.raises(ValueError):
+        split_train_test(np.zeros((2, 1)), np.zeros(2), test_size=0.99)
+
+
+def test_load_data_pipeline_chunked_matches_full_load(tmp_path):
+    """Test that chunked loading yields the same splits as a full load."""
+    csv_path = tmp_path / "scores.csv"
+    pd.DataFrame({
+        "hours_studied": [float(i) for i in range(10)],
+        "exam_difficulty": ["Easy", "Medium", "Hard", "Easy", "Medium"] * 2,
+        "score": [float(i * 10) for i in range(10)]
+    }).to_csv(csv_path, index=False)
+
+    full = load_data_pipeline(csv_path)
+    chunked = load_data_pipeline_chunked(csv_path, chunksize=3)
+
+    assert chunked.feature_names == full.feature_names
+    assert (chunked.X_train == full.X_train).all()
+    assert (chunked.y_test == full.y_test).all()
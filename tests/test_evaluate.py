@@ -0,0 +1,71 @@
+import pytest
+import joblib
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+from src import evaluate
+from src.data import load_data_pipeline
+
+
+@pytest.fixture
+def splits():
+    """Splits of the repo's dataset with the default config."""
+    return load_data_pipeline(
+        data_path=str(project_root / "datasets" / "student_scores_dataset.csv"),
+        target_column="score",
+    )
+
+
+def run_evaluate(monkeypatch, capsys, tmp_path, model_path):
+    """Run the evaluation CLI against model_path and return its metrics."""
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(
+        f"data_path: {project_root / 'datasets' / 'student_scores_dataset.csv'}\n"
+        f"model_path: {model_path}\n"
+    )
+    monkeypatch.setattr(sys, "argv", ["evaluate.py", "--config", str(cfg)])
+    evaluate.main()
+    out = capsys.readouterr().out.splitlines()
+    return {line.split(":")[0]: float(line.split(":")[1]) for line in out}
+
+
+def test_reordered_artifact_matches_pipeline_order(
+    monkeypatch, capsys, tmp_path, splits
+):
+    """Test artifacts stored in another feature order are scored correctly."""
+    reordered = [
+        "difficulty_Medium", "hours_studied", "difficulty_Hard", "difficulty_Easy"
+    ]
+    X_train = pd.DataFrame(splits.X_train, columns=splits.feature_names)
+    reordered_model = LinearRegression().fit(X_train[reordered], splits.y_train)
+    joblib.dump(reordered_model, tmp_path / "reordered.joblib")
+    pipeline_model = LinearRegression().fit(X_train, splits.y_train)
+    joblib.dump(pipeline_model, tmp_path / "pipeline.joblib")
+
+    metrics = run_evaluate(
+        monkeypatch, capsys, tmp_path, tmp_path / "reordered.joblib"
+    )
+    expected = run_evaluate(
+        monkeypatch, capsys, tmp_path, tmp_path / "pipeline.joblib"
+    )
+
+    assert metrics == expected
+    assert metrics["R^2"] > 0
+
+
+def test_align_features_missing_column():
+    """Test a model feature absent from the data raises ValueError."""
+    X = np.zeros((2, 2))
+
+    with pytest.raises(ValueError, match="difficulty_Hard"):
+        evaluate.align_features(
+            X, ["hours_studied", "difficulty_Easy"], ["difficulty_Hard"]
+        )
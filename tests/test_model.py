@@ -0,0 +1,90 @@
+import pytest
+import joblib
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sklearn.linear_model import LinearRegression
+
+from src.model import (
+    DEFAULT_FEATURE_NAMES,
+    LinearPredictor,
+    difficulty_codes,
+    encode_features,
+    load_artifact,
+    save_artifact,
+)
+
+
+@pytest.fixture
+def fitted_model():
+    """Fit a small linear model on a fixed dataset."""
+    X = np.array([[1.0, 1, 0], [2.0, 0, 1], [3.0, 1, 0], [4.0, 0, 1]])
+    y = np.array([10.0, 25.0, 30.0, 45.0])
+    model = LinearRegression()
+    model.fit(X, y)
+    return model, X
+
+
+def test_npz_round_trip(tmp_path, fitted_model):
+    """Test that a .npz artifact reproduces the fitted model's predictions."""
+    model, X = fitted_model
+    feature_names = ["hours_studied", "difficulty_Easy", "difficulty_Hard"]
+
+    path = save_artifact(model, feature_names, tmp_path / "model.npz")
+    artifact = load_artifact(path)
+
+    assert isinstance(artifact["model"], LinearPredictor)
+    assert artifact["feature_names"] == feature_names
+    np.testing.assert_allclose(
+        artifact["model"].predict(X), model.predict(X), rtol=1e-5
+    )
+
+
+def test_joblib_artifact_still_loads(tmp_path, fitted_model):
+    """Test that non-.npz paths are saved and loaded with joblib."""
+    model, X = fitted_model
+
+    path = save_artifact(model, ["a", "b", "c"], tmp_path / "model.joblib")
+    artifact = load_artifact(path)
+
+    assert isinstance(artifact["model"], LinearRegression)
+    assert artifact["feature_names"] == ["a", "b", "c"]
+    # Arrays are memory-mapped read-only and still usable for prediction
+    assert not artifact["model"].coef_.flags.writeable
+    np.testing.assert_allclose(artifact["model"].predict(X), model.predict(X))
+
+
+def test_load_missing_artifact(tmp_path):
+    """Test that a missing artifact raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        load_artifact(tmp_path / "missing.npz")
+
+
+def test_encode_features_places_columns_by_name():
+    """Test one-hot encoding follows feature_names and skips unknown values."""
+    feature_names = ["difficulty_Medium", "hours_studied", "difficulty_Easy"]
+    codes = difficulty_codes(["Easy", "Hard", "Medium", "Unknown"])
+
+    X = encode_features([1.0, 2.0, 3.0, 4.0], codes, feature_names)
+
+    assert X.tolist() == [
+        [0.0, 1.0, 1.0],
+        [0.0, 2.0, 0.0],
+        [1.0, 3.0, 0.0],
+        [0.0, 4.0, 0.0],
+    ]
+
+
+def test_bare_estimator_feature_names(tmp_path, fitted_model):
+    """Test bare joblib estimators fall back to the default feature order."""
+    model, _ = fitted_model
+    joblib.dump(model, tmp_path / "bare.joblib")
+
+    artifact = load_artifact(tmp_path / "bare.joblib")
+
+    assert artifact["feature_names"] == DEFAULT_FEATURE_NAMES
@@ -0,0 +1,107 @@
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import predict
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Config pointing at the repo's trained model."""
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(f"model_path: {project_root / 'models' / 'model.npz'}\n")
+    return str(cfg)
+
+
+def run_cli(monkeypatch, capsys, *args):
+    """Run the prediction CLI with the given arguments and return stdout lines."""
+    monkeypatch.setattr(sys, "argv", ["predict.py", *args])
+    predict.main()
+    return capsys.readouterr().out.splitlines()
+
+
+def test_files_match_single_predictions(monkeypatch, capsys, config_path, tmp_path):
+    """Test file-based predictions agree with one-at-a-time predictions."""
+    rows = [(4.0, "Easy"), (5.5, "Hard"), (0.0, "Medium")]
+    hours_file = tmp_path / "hours.csv"
+    hours_file.write_text("".join(f"{h}\n" for h, _ in rows))
+    difficulty_file = tmp_path / "difficulty.csv"
+    difficulty_file.write_text("".join(f"{d}\n" for _, d in rows))
+
+    batch = run_cli(
+        monkeypatch, capsys, "--config", config_path,
+        "--hours-file", str(hours_file), "--difficulty-file", str(difficulty_file),
+    )
+    singles = [
+        run_cli(
+            monkeypatch, capsys, "--config", config_path,
+            "--hours", str(h), "--difficulty", d,
+        )[0].replace("Predicted score: ", "")
+        for h, d in rows
+    ]
+
+    assert batch == singles
+
+
+def test_single_line_files(monkeypatch, capsys, config_path, tmp_path):
+    """Test one-value files are read as a single row, not a scalar."""
+    hours_file = tmp_path / "hours.csv"
+    hours_file.write_text("5.0\n")
+    difficulty_file = tmp_path / "difficulty.csv"
+    difficulty_file.write_text("Hard\n")
+
+    lines = run_cli(
+        monkeypatch, capsys, "--config", config_path,
+        "--hours-file", str(hours_file), "--difficulty-file", str(difficulty_file),
+    )
+
+    assert len(lines) == 1
+
+
+def test_length_mismatch(monkeypatch, capsys, config_path, tmp_path):
+    """Test hours and difficulty files of different lengths are rejected."""
+    hours_file = tmp_path / "hours.csv"
+    hours_file.write_text("1.0\n2.0\n")
+    difficulty_file = tmp_path / "difficulty.csv"
+    difficulty_file.write_text("Easy\n")
+
+    with pytest.raises(ValueError, match="2 hours values but 1 difficulties"):
+        run_cli(
+            monkeypatch, capsys, "--config", config_path,
+            "--hours-file", str(hours_file), "--difficulty-file", str(difficulty_file),
+        )
+
+
+def test_unknown_difficulty(monkeypatch, capsys, config_path, tmp_path):
+    """Test unknown difficulties in a file are reported by name."""
+    hours_file = tmp_path / "hours.csv"
+    hours_file.write_text("1.0\n2.0\n")
+    difficulty_file = tmp_path / "difficulty.csv"
+    difficulty_file.write_text("Easy\nExtreme\n")
+
+    with pytest.raises(ValueError, match="Extreme"):
+        run_cli(
+            monkeypatch, capsys, "--config", config_path,
+            "--hours-file", str(hours_file), "--difficulty-file", str(difficulty_file),
+        )
+
+
+def test_difficulty_file_requires_hours_file(
+    monkeypatch, capsys, config_path, tmp_path
+):
+    """Test --difficulty-file is rejected when combined with --hours."""
+    difficulty_file = tmp_path / "difficulty.csv"
+    difficulty_file.write_text("Hard\n")
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_cli(
+            monkeypatch, capsys, "--config", config_path,
+            "--hours", "3", "--difficulty-file", str(difficulty_file),
+        )
+
+    assert exc_info.value.code == 2
+    assert "--difficulty-file requires --hours-file" in capsys.readouterr().err
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.predict_batch import _score_batch, _score_batch_numpy, predict_scores
+
+
+FEATURE_NAMES = [
+    "hours_studied",
+    "difficulty_Easy",
+    "difficulty_Hard",
+    "difficulty_Medium",
+]
+COEF = np.array([5.0, 10.0, -10.0, 0.0])
+
+
+def test_predict_scores_uses_feature_names():
+    """Test that difficulties map to coefficients by feature name."""
+    preds = predict_scores(
+        [1.0, 1.0, 1.0], ["Easy", "Medium", "Hard"], COEF, 20.0, FEATURE_NAMES
+    )
+    np.testing.assert_allclose(preds, [35.0, 25.0, 15.0])
+
+
+def test_predict_scores_clamps_to_valid_range():
+    """Test that predictions are clamped to 0-100."""
+    preds = predict_scores(
+        [-10.0, 50.0], ["Hard", "Easy"], COEF, 20.0, FEATURE_NAMES
+    )
+    np.testing.assert_allclose(preds, [0.0, 100.0])
+
+
+def test_compiled_kernel_matches_numpy_fallback():
+    """Test that the compiled kernel and numpy fallback agree."""
+    rng = np.random.default_rng(0)
+    hours = rng.uniform(0, 12, size=50)
+    diff_cols = rng.integers(-1, 4, size=50)
+    hours[:2] = np.nan
+
+    np.testing.assert_allclose(
+        _score_batch(hours, diff_cols, COEF, 0, 20.0),
+        _score_batch_numpy(hours, diff_cols, COEF, 0, 20.0),
+    )
+
+
+def test_predict_scores_is_thread_safe():
+    """Test concurrent calls survive numba's non-thread-safe workqueue layer."""
+    script = (
+        "import numpy as np\n"
+        "from concurrent.futures import ThreadPoolExecutor\n"
+        "from src.predict_batch import predict_scores\n"
+        "idx = ['hours_studied', 'difficulty_Easy']\n"
+        "coef = np.array([5.0, 10.0])\n"
+        "def run(_):\n"
+        "    for _ in range(200):\n"
+        "        predict_scores([1.0] * 64, ['Easy'] * 64, coef, 20.0, idx)\n"
+        "with ThreadPoolExecutor(8) as pool:\n"
+        "    list(pool.map(run, range(8)))\n"
+    )
+    env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue")
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=project_root, env=env,
+        capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
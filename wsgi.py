@@ -0,0 +1,8 @@
+"""WSGI entrypoint for production servers.
+
+Run with, for example:
+    gunicorn -w 4 -k gthread --threads 8 --preload -b 0.0.0.0:5000 wsgi:app
+"""
+from src.app import app
+
+__all__ = ["app"]